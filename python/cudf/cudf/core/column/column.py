@@ -389,6 +389,7 @@ class ColumnBase(Column, Serializable):
             self.set_base_mask(mask)
 
         libcudf.filling.fill_in_place(self, begin, end, fill_scalar)
+        self._clear_scan_cache()
 
         return self
 
@@ -820,9 +821,37 @@ class ColumnBase(Column, Serializable):
 
         return cudf.io.dlpack.to_dlpack(self)
 
+    # Uniqueness and monotonicity are expensive to compute (each one is a
+    # full scan of the column) but remain valid for as long as the device
+    # data is unchanged, so they are computed lazily by the properties
+    # below and reset by every in-place mutation entry point
+    # (`_mimic_inplace`, `_fill`, and the `set_base_*` setters).
+    _is_unique: Optional[bool] = None
+    _is_monotonic_increasing: Optional[bool] = None
+    _is_monotonic_decreasing: Optional[bool] = None
+
+    def _clear_scan_cache(self) -> None:
+        self._is_unique = None
+        self._is_monotonic_increasing = None
+        self._is_monotonic_decreasing = None
+
+    def set_base_data(self, value):
+        self._clear_scan_cache()
+        super().set_base_data(value)
+
+    def set_base_mask(self, value):
+        self._clear_scan_cache()
+        super().set_base_mask(value)
+
+    def set_base_children(self, value):
+        self._clear_scan_cache()
+        super().set_base_children(value)
+
     @property
     def is_unique(self) -> bool:
-        return self.distinct_count() == len(self)
+        if self._is_unique is None:
+            self._is_unique = self.distinct_count() == len(self)
+        return self._is_unique
 
     @property
     def is_monotonic(self) -> bool:
@@ -830,15 +859,32 @@ class ColumnBase(Column, Serializable):
 
     @property
     def is_monotonic_increasing(self) -> bool:
-        return not self.has_nulls and self.as_frame()._is_sorted(
-            ascending=None, null_position=None
-        )
+        if self._is_monotonic_increasing is None:
+            self._is_monotonic_increasing = (
+                not self.has_nulls
+                and self.as_frame()._is_sorted(
+                    ascending=None, null_position=None
+                )
+            )
+        return self._is_monotonic_increasing
 
     @property
     def is_monotonic_decreasing(self) -> bool:
-        return not self.has_nulls and self.as_frame()._is_sorted(
-            ascending=[False], null_position=None
-        )
+        if self._is_monotonic_decreasing is None:
+            self._is_monotonic_decreasing = (
+                not self.has_nulls
+                and self.as_frame()._is_sorted(
+                    ascending=[False], null_position=None
+                )
+            )
+        return self._is_monotonic_decreasing
+
+    def _mimic_inplace(
+        self, other_col: ColumnBase, inplace: bool = False
+    ) -> Optional[ColumnBase]:
+        if inplace:
+            self._clear_scan_cache()
+        return super()._mimic_inplace(other_col, inplace)
 
     def get_slice_bound(
         self, label: ScalarLike, side: builtins.str, kind: builtins.str
@@ -19,6 +19,7 @@ from typing import (
 import pandas as pd
 
 import cudf
+from cudf.api.types import is_numeric_dtype
 from cudf.core import column
 from cudf.utils.utils import cached_property
 
@@ -224,6 +225,13 @@ class ColumnAccessor(MutableMapping):
         else:
             return self._data
 
+    @cached_property
+    def _all_numeric(self) -> bool:
+        """True when every column in the accessor has a numeric dtype."""
+        return all(
+            is_numeric_dtype(col.dtype) for col in self._data.values()
+        )
+
     @cached_property
     def _column_length(self):
         try:
@@ -232,7 +240,12 @@ class ColumnAccessor(MutableMapping):
             return 0
 
     def _clear_cache(self):
-        cached_properties = ("columns", "names", "_grouped_data")
+        cached_properties = (
+            "columns",
+            "names",
+            "_grouped_data",
+            "_all_numeric",
+        )
         for attr in cached_properties:
             try:
                 self.__delattr__(attr)
@@ -8,16 +8,13 @@ import pandas as pd
 from nvtx import annotate
 
 import cudf
+import cudf._lib as libcudf
 from cudf._lib.concat import concat_columns
 from cudf._lib.scalar import _is_null_host_scalar
 from cudf._typing import ColumnLike, DataFrameOrSeries, ScalarLike
-from cudf.api.types import (
-    is_bool_dtype,
-    is_integer,
-    is_integer_dtype,
-    is_numeric_dtype,
-)
-from cudf.core.column.column import as_column
+from cudf.api.types import is_bool_dtype, is_integer, is_integer_dtype
+from cudf.core.column.column import as_column, build_column, column_empty
+from cudf.utils import cudautils
 from cudf.utils.dtypes import (
     _is_non_decimal_numeric_dtype,
     _is_scalar_or_zero_d_array,
@@ -47,6 +44,80 @@ def indices_from_labels(obj, labels):
         else:
             labels = labels.astype(obj.index.dtype)
 
+        if (
+            obj.index.is_monotonic_increasing
+            and obj.index.is_unique
+            and not is_categorical_dtype(obj.index)
+        ):
+            # For a sorted unique index we can replace the hash join below
+            # with a single binary search (libcudf ``lower_bound``) followed
+            # by a validating gather. A non-unique index must take the join
+            # path, which returns one row per duplicate match. Categorical
+            # indexes keep the join path: the labels above are rebuilt with
+            # their own category set, which binary search cannot reconcile.
+            positions = column.as_column(
+                obj.index._values.searchsorted(labels, side="left")
+            )
+            # labels greater than the last index entry get positions one
+            # past the end of the index; `nullify` turns those into nulls
+            # so that, like the join, missing labels produce null indices
+            hits = obj.index._values.take(positions, nullify=True) == labels
+            positions = positions.set_mask(hits.fillna(False).as_mask())
+            return cudf.Series(
+                positions, index=cudf.core.index.as_index(labels)
+            )
+
+        if obj.index.is_monotonic_increasing and not is_categorical_dtype(
+            obj.index
+        ):
+            # Sorted but non-unique: two binary searches give each label
+            # its [lower, upper) run of matching row positions, and the
+            # runs are expanded arithmetically in label order, so neither
+            # the join's hash table nor its output sort is needed.
+            index_col = obj.index._values
+            lb = cp.asarray(index_col.searchsorted(labels, side="left"))
+            ub = cp.asarray(index_col.searchsorted(labels, side="right"))
+            counts = ub - lb
+            found = counts > 0
+            # missing labels still emit one (null) row, like a left join
+            counts = cp.where(found, counts, 1)
+            boundaries = cp.cumsum(counts)
+            total = int(boundaries[-1]) if len(boundaries) else 0
+            row = cp.arange(total)
+            ids = cp.searchsorted(boundaries, row, side="right")
+            positions = column.as_column(
+                lb[ids] + (row - (boundaries - counts)[ids])
+            )
+            positions = positions.set_mask(
+                column.as_column(found[ids]).as_mask()
+            )
+            return cudf.Series(
+                positions,
+                index=cudf.core.index.as_index(
+                    labels.take(column.as_column(ids))
+                ),
+            )
+
+        if obj.index.is_unique and not is_categorical_dtype(obj.index):
+            # The gather maps returned by libcudf's hash join come back
+            # unordered, but with a unique index every label matches at
+            # most once, so scattering the right-hand map into label
+            # order replaces the join-output sort below entirely. The
+            # all-null target leaves missing labels null, just like the
+            # left join.
+            left_rows, right_rows = libcudf.join.join(
+                labels.as_frame(), obj.index._values.as_frame(), how="inner"
+            )
+            positions = (
+                column_empty(len(labels), dtype=right_rows.dtype, masked=True)
+                .as_frame()
+                ._scatter(left_rows, right_rows.as_frame())
+                ._as_column()
+            )
+            return cudf.Series(
+                positions, index=cudf.core.index.as_index(labels)
+            )
+
     # join is not guaranteed to maintain the index ordering
     # so we will sort it with its initial ordering which is stored
     # in column "__"
@@ -59,26 +130,81 @@ def get_label_range_or_mask(index, start, stop, step):
     if (
         not (start is None and stop is None)
         and type(index) is cudf.core.index.DatetimeIndex
-        and index.is_monotonic is False
+        and index.is_monotonic_increasing is False
     ):
-        start = pd.to_datetime(start)
-        stop = pd.to_datetime(stop)
+        # pd.to_datetime runs pandas' full type-inference machinery on
+        # the host for every slice; skip it for bounds that are already
+        # datetime scalars
+        if not (
+            start is None or isinstance(start, (np.datetime64, pd.Timestamp))
+        ):
+            start = pd.to_datetime(start)
+        if not (
+            stop is None or isinstance(stop, (np.datetime64, pd.Timestamp))
+        ):
+            stop = pd.to_datetime(stop)
+        index_col = index._values
         if start is not None and stop is not None:
             if start > stop:
                 return slice(0, 0, None)
-            # TODO: Once Index binary ops are updated to support logical_and,
-            # can use that instead of using cupy.
-            boolean_mask = cp.logical_and((index >= start), (index <= stop))
+            if index_col.has_nulls:
+                # the fused kernel below reads the raw device values, so
+                # NaT slots must go through the null-aware comparisons
+                boolean_mask = (
+                    index_col >= index_col.normalize_binop_value(start)
+                ) & (index_col <= index_col.normalize_binop_value(stop))
+            else:
+                # Fusing the two comparisons into one kernel reads the
+                # index column once rather than launching three kernels
+                # (two comparisons plus the logical and) that each
+                # traverse it. ``to_datetime64`` keeps the full
+                # nanosecond precision of Timestamp bounds, like
+                # DatetimeColumn.normalize_binop_value.
+                boolean_mask = as_column(
+                    cudautils.mask_between(
+                        index_col.as_numerical.data_array_view,
+                        pd.Timestamp(start)
+                        .to_datetime64()
+                        .astype(index.dtype)
+                        .astype("int64"),
+                        pd.Timestamp(stop)
+                        .to_datetime64()
+                        .astype(index.dtype)
+                        .astype("int64"),
+                    )
+                )
         elif start is not None:
-            boolean_mask = index >= start
+            boolean_mask = index_col >= index_col.normalize_binop_value(start)
         else:
-            boolean_mask = index <= stop
+            boolean_mask = index_col <= index_col.normalize_binop_value(stop)
         return boolean_mask
     else:
         start, stop = index.find_label_range(start, stop)
         return slice(start, stop, step)
 
 
+# value-classification tags for ``_SeriesIlocIndexer.__setitem__``
+_SET_SCALAR = 0  # coerce with to_cudf_compatible_scalar
+_SET_NESTED = 1  # list/dict assigned into a list/struct column, used as-is
+_SET_COLUMN = 2  # coerce with as_column
+
+
+def _classify_setitem_value(value, col_dtype):
+    """Classify a ``__setitem__`` value into one of the ``_SET_*`` tags.
+
+    Running the type predicates once up front lets ``__setitem__``
+    dispatch on a single tag instead of re-evaluating the
+    scalar/list-like cascade in every branch.
+    """
+    if is_scalar(value):
+        return _SET_SCALAR
+    if isinstance(value, (list, dict)) and isinstance(
+        col_dtype, (cudf.ListDtype, cudf.StructDtype)
+    ):
+        return _SET_NESTED
+    return _SET_COLUMN
+
+
 class _SeriesIlocIndexer(object):
     """
     For integer-location based selection.
@@ -88,6 +214,10 @@ class _SeriesIlocIndexer(object):
         self._sr = sr
 
     def __getitem__(self, arg):
+        if is_integer(arg):
+            # a scalar integer position maps onto a single libcudf
+            # get_element call; skip the general dispatch below
+            return self._sr._column.element_indexing(arg)
         if isinstance(arg, tuple):
             arg = list(arg)
         data = self._sr._column[arg]
@@ -98,8 +228,12 @@ class _SeriesIlocIndexer(object):
             or _is_null_host_scalar(data)
         ):
             return data
+        # index.take already hands back a fully formed Index (and slice
+        # args turn into a zero-copy metadata slice rather than a gather
+        # kernel), so re-wrapping it in the Index constructor would only
+        # re-run dtype validation
         return self._sr._from_data(
-            {self._sr.name: data}, index=cudf.Index(self._sr.index.take(arg))
+            {self._sr.name: data}, index=self._sr.index.take(arg)
         )
 
     def __setitem__(self, key, value):
@@ -108,34 +242,31 @@ class _SeriesIlocIndexer(object):
         if isinstance(key, tuple):
             key = list(key)
 
-        # coerce value into a scalar or column
-        if is_scalar(value):
+        col = self._sr._column
+        col_dtype = col.dtype
+
+        # classify the value once and dispatch on the tag instead of
+        # re-running the predicate cascade for every branch
+        tag = _classify_setitem_value(value, col_dtype)
+        if tag is _SET_SCALAR:
             value = to_cudf_compatible_scalar(value)
-        elif not (
-            isinstance(value, (list, dict))
-            and isinstance(
-                self._sr._column.dtype, (cudf.ListDtype, cudf.StructDtype)
-            )
-        ):
+        elif tag is _SET_COLUMN:
             value = column.as_column(value)
 
         if (
             not isinstance(
-                self._sr._column.dtype,
-                (cudf.Decimal64Dtype, cudf.CategoricalDtype),
+                col_dtype, (cudf.Decimal64Dtype, cudf.CategoricalDtype)
             )
             and hasattr(value, "dtype")
             and _is_non_decimal_numeric_dtype(value.dtype)
         ):
             # normalize types if necessary:
             if not is_integer(key):
-                to_dtype = np.result_type(value.dtype, self._sr._column.dtype)
+                to_dtype = np.result_type(value.dtype, col_dtype)
                 value = value.astype(to_dtype)
-                self._sr._column._mimic_inplace(
-                    self._sr._column.astype(to_dtype), inplace=True
-                )
+                col._mimic_inplace(col.astype(to_dtype), inplace=True)
 
-        self._sr._column[key] = value
+        col[key] = value
 
 
 class _SeriesLocIndexer(object):
@@ -199,10 +330,30 @@ class _SeriesLocIndexer(object):
                 elif is_integer(arg):
                     found_index = arg
                     return found_index
-            try:
-                found_index = self._sr.index._values.find_first_value(
-                    arg, closest=False
+            index_col = self._sr.index._values
+            if (
+                _is_non_decimal_numeric_dtype(index_col.dtype)
+                and index_col.is_monotonic_increasing
+                and index_col.is_unique
+            ):
+                # a sorted unique index can be binary searched
+                # (libcudf lower_bound) instead of scanned; the label is
+                # cast to the index dtype since lower_bound requires
+                # matching column types, and the result comes back as a
+                # length-1 device array
+                found_index = int(
+                    index_col.searchsorted(
+                        to_cudf_compatible_scalar(arg, index_col.dtype),
+                        side="left",
+                    )[0]
                 )
+                if found_index < len(index_col) and (
+                    index_col.element_indexing(found_index) == arg
+                ):
+                    return found_index
+                raise KeyError("label scalar is out of bound")
+            try:
+                found_index = index_col.find_first_value(arg, closest=False)
                 return found_index
             except (TypeError, KeyError, IndexError, ValueError):
                 raise KeyError("label scalar is out of bound")
@@ -218,10 +369,13 @@ class _SeriesLocIndexer(object):
             return indices_from_labels(self._sr, arg)
 
         else:
-            arg = cudf.core.series.Series(cudf.core.column.as_column(arg))
-            if arg.dtype in (bool, np.bool_):
-                return arg
+            arg = cudf.core.column.as_column(arg)
+            if is_bool_dtype(arg.dtype):
+                return cudf.core.series.Series(arg)
             else:
+                # indices_from_labels batches the whole label list into
+                # one binary search when the index is sorted and unique,
+                # and one join otherwise
                 indices = indices_from_labels(self._sr, arg)
                 if indices.null_count > 0:
                     raise KeyError("label scalar is out of bound")
@@ -229,22 +383,32 @@ class _SeriesLocIndexer(object):
 
 
 class _DataFrameIndexer(object):
+    def __init__(self, df):
+        self._df = df
+        # Bind the argument handler once per indexer rather than
+        # re-running the MultiIndex checks on every __getitem__ call.
+        # Indexers are constructed anew by the `loc`/`iloc` properties,
+        # so the binding cannot go stale on index replacement.
+        if isinstance(df.index, cudf.MultiIndex):
+            self._getitem_impl = self._getitem_multiindex_arg
+        else:
+            self._getitem_impl = self._getitem_simple_arg
+
     def __getitem__(self, arg):
-        from cudf import MultiIndex
+        return self._getitem_impl(arg)
 
-        if isinstance(self._df.index, MultiIndex) or isinstance(
-            self._df.columns, MultiIndex
-        ):
-            # This try/except block allows the use of pandas-like
-            # tuple arguments into MultiIndex dataframes.
-            try:
-                return self._getitem_tuple_arg(arg)
-            except (TypeError, KeyError, IndexError, ValueError):
-                return self._getitem_tuple_arg((arg, slice(None)))
-        else:
-            if not isinstance(arg, tuple):
-                arg = (arg, slice(None))
+    def _getitem_multiindex_arg(self, arg):
+        # This try/except block allows the use of pandas-like
+        # tuple arguments into MultiIndex dataframes.
+        try:
             return self._getitem_tuple_arg(arg)
+        except (TypeError, KeyError, IndexError, ValueError):
+            return self._getitem_tuple_arg((arg, slice(None)))
+
+    def _getitem_simple_arg(self, arg):
+        if not isinstance(arg, tuple):
+            arg = (arg, slice(None))
+        return self._getitem_tuple_arg(arg)
 
     def __setitem__(self, key, value):
         if not isinstance(key, tuple):
@@ -278,9 +442,9 @@ class _DataFrameIndexer(object):
                     arg[1], slice
                 ):
                     return True
-            dtypes = df.dtypes.values.tolist()
-            all_numeric = all([is_numeric_dtype(t) for t in dtypes])
-            if all_numeric:
+            # the all-numeric flag is cached on the ColumnAccessor, so
+            # repeated indexer calls skip the per-column dtype scan
+            if df._data._all_numeric:
                 return True
         if ncols == 1:
             if type(arg[1]) is slice:
@@ -329,9 +493,6 @@ class _DataFrameLocIndexer(_DataFrameIndexer):
     For selection by label.
     """
 
-    def __init__(self, df):
-        self._df = df
-
     def _getitem_scalar(self, arg):
         return self._df[arg[1]].loc[arg[0]]
 
@@ -347,7 +508,6 @@ class _DataFrameLocIndexer(_DataFrameIndexer):
         # Step 1: Gather columns
         if isinstance(arg, tuple):
             columns_df = self._get_column_selection(arg[1])
-            columns_df._index = self._df._index
         else:
             columns_df = self._df
 
@@ -387,6 +547,19 @@ class _DataFrameLocIndexer(_DataFrameIndexer):
 
                 if is_bool_dtype(tmp_arg[0]):
                     df = columns_df._apply_boolean_mask(tmp_arg[0])
+                elif columns_df.index.is_unique:
+                    # A unique index cannot fan out one label into several
+                    # rows, so the labels map straight to row positions
+                    # and a single gather replaces the uuid-keyed join
+                    # plus sort below.
+                    indices = indices_from_labels(columns_df, tmp_arg[0])
+                    if indices.null_count > 0:
+                        # mirror the inner join: missing labels drop out
+                        indices = indices.dropna()
+                    if len(indices) == 0:
+                        # There were no indices found
+                        raise KeyError(arg)
+                    df = columns_df.take(indices)
                 else:
                     tmp_col_name = str(uuid4())
                     other_df = DataFrame(
@@ -457,6 +630,9 @@ class _DataFrameLocIndexer(_DataFrameIndexer):
                 )
             self._df._data.insert(key[1], new_col)
         else:
+            if len(columns_df._column_names) == 0:
+                return
+
             if isinstance(value, (cp.ndarray, np.ndarray)):
                 value_df = cudf.DataFrame(value)
                 if value_df.shape[1] != columns_df.shape[1]:
@@ -473,14 +649,47 @@ class _DataFrameLocIndexer(_DataFrameIndexer):
                         )
                 else:
                     value_cols = value_df._data.columns
-                for i, col in enumerate(columns_df._column_names):
-                    self._df[col].loc[key[0]] = value_cols[i]
             else:
-                for col in columns_df._column_names:
-                    self._df[col].loc[key[0]] = value
+                value_cols = None
+
+            # All of the selected columns share ``self._df``'s index, so
+            # the loc->iloc translation of the row key is identical for
+            # every one of them; resolve it once instead of per column.
+            try:
+                iloc_key = self._df[
+                    columns_df._column_names[0]
+                ].loc._loc_to_iloc(key[0])
+            except KeyError:
+                # a missing scalar label appends a new row, which the
+                # per-column loc assignment below knows how to do
+                iloc_key = None
+            else:
+                if isinstance(value, (pd.Series, cudf.Series)):
+                    value = cudf.Series(value)._align_to_index(
+                        self._df.index, how="right"
+                    )
+
+            if iloc_key is not None and value_cols is not None:
+                # the broadcast can land in all target columns with one
+                # libcudf table scatter when the dtypes already line up
+                if _scatter_columns_inplace(
+                    self._df, columns_df._column_names, iloc_key, value_cols
+                ):
+                    return
+
+            for i, col in enumerate(columns_df._column_names):
+                col_value = value if value_cols is None else value_cols[i]
+                if iloc_key is None:
+                    self._df[col].loc[key[0]] = col_value
+                else:
+                    self._df[col].iloc[iloc_key] = col_value
 
     def _get_column_selection(self, arg):
-        return self._df._get_columns_by_label(arg)
+        # share the parent's index as a reference rather than letting
+        # the DataFrame constructor rebuild and revalidate it
+        return cudf.DataFrame._from_data(
+            self._df._data.select_by_label(arg), index=self._df._index
+        )
 
 
 class _DataFrameIlocIndexer(_DataFrameIndexer):
@@ -488,19 +697,42 @@ class _DataFrameIlocIndexer(_DataFrameIndexer):
     For selection by index.
     """
 
-    def __init__(self, df):
-        self._df = df
-
     @annotate("ILOC_GETITEM", color="blue", domain="cudf_python")
     def _getitem_tuple_arg(self, arg):
         from cudf import MultiIndex
         from cudf.core.column import column
         from cudf.core.index import as_index
 
+        # Iloc Step 0:
+        # Specialize the common ``df.iloc[i]`` case. The general path
+        # materializes a one-row DataFrame and transposes it on the
+        # device; gathering one host scalar per column builds the same
+        # Series directly.
+        if (
+            isinstance(arg[1], slice)
+            and arg[1] == slice(None)
+            and is_integer(arg[0])
+            and not isinstance(self._df.index, MultiIndex)
+            and self._df._num_columns > 0
+            and self._df._data._all_numeric
+        ):
+            row = arg[0]
+            if row < 0:
+                row += len(self._df)
+            cols = self._df._data.columns
+            if 0 <= row < len(self._df) and not any(
+                col.has_nulls for col in cols
+            ):
+                return cudf.Series(
+                    [col.element_indexing(row) for col in cols],
+                    index=as_index(self._df.columns),
+                    name=self._df.index[row],
+                    dtype=np.result_type(*(col.dtype for col in cols)),
+                )
+
         # Iloc Step 1:
         # Gather the columns specified by the second tuple arg
         columns_df = self._get_column_selection(arg[1])
-        columns_df._index = self._df._index
 
         # Iloc Step 2:
         # Gather the rows specified by the first tuple arg
@@ -548,9 +780,32 @@ class _DataFrameIlocIndexer(_DataFrameIndexer):
 
     @annotate("ILOC_SETITEM", color="blue", domain="cudf_python")
     def _setitem_tuple_arg(self, key, value):
-        columns = self._get_column_selection(key[1])
+        columns_df = self._get_column_selection(key[1])
+        column_names = columns_df._column_names
+        if len(column_names) == 0:
+            return
+
+        # The row key is already positional and shared by every target
+        # column, so when no column would need a dtype promotion for the
+        # value, the per-column scatters collapse into a single libcudf
+        # scatter over all target columns.
+        if is_scalar(value):
+            scalar = to_cudf_compatible_scalar(value)
+            value_dtype = getattr(scalar, "dtype", None)
+            if all(
+                _is_non_decimal_numeric_dtype(col.dtype)
+                and (
+                    value_dtype is None
+                    or is_integer(key[0])
+                    or np.result_type(value_dtype, col.dtype) == col.dtype
+                )
+                for col in columns_df._data.columns
+            ) and _scatter_columns_inplace(
+                self._df, column_names, key[0], [scalar] * len(column_names)
+            ):
+                return
 
-        for col in columns:
+        for col in column_names:
             self._df[col].iloc[key[0]] = value
 
     def _getitem_scalar(self, arg):
@@ -558,24 +813,159 @@ class _DataFrameIlocIndexer(_DataFrameIndexer):
         return self._df[col].iloc[arg[0]]
 
     def _get_column_selection(self, arg):
-        return cudf.DataFrame(self._df._get_columns_by_index(arg))
+        # build the result around the sliced ColumnAccessor directly
+        # instead of round-tripping the columns through the DataFrame
+        # constructor and its name/dtype revalidation
+        return cudf.DataFrame._from_data(
+            self._df._data.select_by_index(arg), index=self._df._index
+        )
 
 
 def _normalize_dtypes(df):
-    if len(df.columns) > 0:
-        dtypes = df.dtypes.values.tolist()
+    if len(df._data) > 0:
+        dtypes = [col.dtype for col in df._data.columns]
         normalized_dtype = np.result_type(*dtypes)
         for name, col in df._data.items():
-            df[name] = col.astype(normalized_dtype)
+            # only launch cast kernels for columns that need one
+            if col.dtype != normalized_dtype:
+                df[name] = col.astype(normalized_dtype)
     return df
 
 
+def _scatter_columns_inplace(df, column_names, iloc_key, values):
+    """Scatter ``values`` (one column or one host scalar per target
+    column) into the named columns of ``df`` with a single libcudf
+    scatter instead of one kernel launch per column.
+
+    Returns False when the key, lengths, or dtypes rule the fused path
+    out, in which case the caller falls back to per-column assignment
+    (which normalizes mismatched dtypes on the way).
+    """
+    from cudf.core.column import column
+
+    target_cols = [df._data[name] for name in column_names]
+    all_scalars = all(is_scalar(value) for value in values)
+    if not all_scalars:
+        if any(is_scalar(value) for value in values):
+            return False
+        if any(
+            target.dtype != value.dtype
+            for target, value in zip(target_cols, values)
+        ):
+            return False
+
+    if isinstance(iloc_key, slice):
+        scatter_map = column.arange(*iloc_key.indices(len(df)))
+    elif is_scalar(iloc_key):
+        if not is_integer(iloc_key):
+            return False
+        scatter_map = as_column(iloc_key, length=1, dtype="int32")
+    else:
+        scatter_map = as_column(iloc_key)
+        if is_bool_dtype(scatter_map.dtype):
+            if len(scatter_map) != len(df):
+                return False
+            scatter_map = column.arange(len(df)).apply_boolean_mask(
+                scatter_map
+            )
+        elif not is_integer_dtype(scatter_map.dtype):
+            return False
+
+    if not all_scalars and any(
+        len(value) != len(scatter_map) for value in values
+    ):
+        return False
+
+    target = cudf.core.frame.Frame(dict(zip(column_names, target_cols)))
+    try:
+        if all_scalars:
+            result = target._scatter(scatter_map, list(values))
+        else:
+            source = cudf.core.frame.Frame(dict(zip(column_names, values)))
+            result = target._scatter(scatter_map, source)
+    except RuntimeError as e:
+        # translate out-of-bounds scatters the same way
+        # ColumnBase.__setitem__ does on the per-column path
+        if "out of bounds" in str(e):
+            raise IndexError(
+                f"index out of bounds for column of size {len(df)}"
+            ) from e
+        raise
+    for name in column_names:
+        df._data[name]._mimic_inplace(result._data[name], inplace=True)
+    return True
+
+
+def _append_scalar_inplace(col: ColumnLike, value: Any):
+    """Append `value`, already of `col`'s dtype, to the end of `col` by
+    writing into slack capacity of a geometrically over-allocated base
+    buffer, so that n successive appends move O(n) bytes in total
+    instead of O(n^2).
+    """
+    new_size = len(col) + 1
+    # Slack capacity in the base buffer is only trusted when it was
+    # allocated by a previous append to this same column; a buffer
+    # inherited from anywhere else may be shared with other columns
+    # that are live beyond ``len(col)``.
+    if (
+        col.offset == 0
+        and col.base_data is not None
+        and getattr(col, "_append_buffer", None) is col.base_data
+    ):
+        capacity = col.base_data.size // col.dtype.itemsize
+    else:
+        capacity = len(col)
+    if new_size > capacity:
+        grown = column_empty(max(2 * capacity, 8), dtype=col.dtype)
+        if len(col):
+            cp.asarray(grown.data_array_view)[: len(col)] = cp.asarray(
+                col.data_array_view
+            )
+        base = grown.base_data
+    else:
+        base = col.base_data
+    cp.asarray(base).view(col.dtype)[new_size - 1] = value
+    col._mimic_inplace(
+        build_column(base, dtype=col.dtype, size=new_size), inplace=True
+    )
+    col._append_buffer = base
+
+
 def _append_new_row_inplace(col: ColumnLike, value: ScalarLike):
     """Append a scalar `value` to the end of `col` inplace.
        Cast to common type if possible
     """
+    # In the common case the scalar's native numpy type already matches
+    # the column dtype, leaving nothing to resolve: skip find_common_type
+    # and the one-element column build and write the host value directly.
+    try:
+        value_dtype = np.dtype(type(value))
+    except TypeError:
+        value_dtype = None
+    if (
+        value_dtype is not None
+        and value_dtype == col.dtype
+        and _is_non_decimal_numeric_dtype(col.dtype)
+        and not col.has_nulls
+        and value == value  # NaN must take the null-aware path below
+    ):
+        _append_scalar_inplace(col, value)
+        return
+
     to_type = find_common_type([type(value), col.dtype])
     val_col = as_column(value, dtype=to_type)
+
+    if (
+        _is_non_decimal_numeric_dtype(to_type)
+        and to_type == col.dtype
+        and not col.has_nulls
+        and not val_col.has_nulls
+    ):
+        _append_scalar_inplace(
+            col, cp.asarray(val_col.data_array_view)[0]
+        )
+        return
+
     old_col = col.astype(to_type)
 
     col._mimic_inplace(concat_columns([old_col, val_col]), inplace=True)
@@ -1481,3 +1481,116 @@ def test_iloc_decimal():
         cudf.Decimal64Dtype(scale=2, precision=3)
     )
     assert_eq(expect.reset_index(drop=True), got.reset_index(drop=True))
+
+
+def test_series_setitem_loc_repeated_append():
+    psr = pd.Series([1.0, 2.0, 3.0], index=[1, 2, 3])
+    gsr = cudf.from_pandas(psr)
+    # enough appends to force several buffer growths
+    for key in range(4, 20):
+        psr.loc[key] = float(key)
+        gsr.loc[key] = float(key)
+    assert_eq(psr, gsr)
+
+
+def test_series_setitem_loc_append_empty():
+    psr = pd.Series([], dtype="float64", index=pd.Index([], dtype="int64"))
+    gsr = cudf.from_pandas(psr)
+    psr.loc[0] = 1.0
+    gsr.loc[0] = 1.0
+    assert_eq(psr, gsr)
+
+
+def test_series_setitem_loc_append_sliced():
+    gsr = cudf.Series([1, 2, 3, 4], index=[1, 2, 3, 4])
+    sliced = gsr.iloc[1:]
+    sliced.loc[5] = 5
+    assert_eq(sliced, cudf.Series([2, 3, 4, 5], index=[2, 3, 4, 5]))
+    # the append must not write through the slice into the parent
+    assert_eq(gsr, cudf.Series([1, 2, 3, 4], index=[1, 2, 3, 4]))
+
+
+def test_loc_sorted_nonunique_index_duplicates():
+    psr = pd.Series(range(6), index=[1, 2, 2, 3, 3, 3])
+    gsr = cudf.from_pandas(psr)
+    # each label fans out into its full run of duplicates, in label order
+    assert_eq(psr.loc[[2, 3]], gsr.loc[[2, 3]])
+    assert_eq(psr.loc[[3, 2, 2]], gsr.loc[[3, 2, 2]])
+
+    pdf = pd.DataFrame({"a": range(6)}, index=[1, 2, 2, 3, 3, 3])
+    gdf = cudf.from_pandas(pdf)
+    assert_eq(pdf.loc[[2, 3]], gdf.loc[[2, 3]])
+
+
+def test_loc_sorted_nonunique_index_missing_label():
+    psr = pd.Series(range(6), index=[1, 2, 2, 3, 3, 3])
+    gsr = cudf.from_pandas(psr)
+    assert_exceptions_equal(
+        lambda: psr.loc[[2, 7]], lambda: gsr.loc[[2, 7]]
+    )
+
+
+def test_dataframe_loc_unique_index_missing_labels():
+    gdf = cudf.DataFrame({"a": [1, 2, 3]}, index=[10, 30, 20])
+    pdf = gdf.to_pandas()
+    # labels without a match drop out of the result (inner-join
+    # semantics, unlike pandas which raises)
+    assert_eq(
+        gdf.loc[[10, 20, 40]],
+        cudf.DataFrame({"a": [1, 3]}, index=[10, 20]),
+    )
+    # when no label matches, loc raises like pandas
+    assert_exceptions_equal(
+        lambda: pdf.loc[[40, 50]], lambda: gdf.loc[[40, 50]]
+    )
+
+
+@pytest.mark.parametrize(
+    "key, value",
+    [
+        (0, 9),
+        (-1, 9),
+        (slice(1, 3), 9),
+        (slice(1, 3), 9.5),
+        ([0, 2], 9),
+        ([0, 2], 9.5),
+        ([True, False, True, False], 9),
+        ([True, False, True, False], 9.5),
+    ],
+)
+def test_dataframe_iloc_setitem_scalar_broadcast(key, value):
+    # all-numeric frames take the fused multi-column scatter; dtype
+    # promotion sends non-integer keys down the per-column fallback
+    pdf = pd.DataFrame({"a": [1, 2, 3, 4], "b": [5.0, 6.0, 7.0, 8.0]})
+    gdf = cudf.from_pandas(pdf)
+    pdf.iloc[key] = value
+    gdf.iloc[key] = value
+    assert_eq(pdf, gdf, check_dtype=False)
+
+
+@pytest.mark.parametrize("key", [0, -1])
+def test_dataframe_iloc_setitem_scalar_integer_key_truncates(key):
+    # for integer keys cudf keeps the column dtype and truncates the
+    # scalar, where pandas upcasts the column
+    gdf = cudf.DataFrame({"a": [1, 2, 3, 4], "b": [5.0, 6.0, 7.0, 8.0]})
+    gdf.iloc[key] = 9.5
+    a = [1, 2, 3, 4]
+    b = [5.0, 6.0, 7.0, 8.0]
+    a[key] = 9
+    b[key] = 9.5
+    assert_eq(gdf, cudf.DataFrame({"a": a, "b": b}))
+
+
+def test_dataframe_loc_setitem_array_broadcast():
+    pdf = pd.DataFrame(
+        {"a": [1, 2, 3, 4], "b": [5, 6, 7, 8]}, index=[1, 2, 3, 4]
+    )
+    gdf = cudf.from_pandas(pdf)
+    # matching dtypes take the fused table scatter
+    pdf.loc[[2, 4], ["a", "b"]] = np.array([[10, 20], [30, 40]])
+    gdf.loc[[2, 4], ["a", "b"]] = np.array([[10, 20], [30, 40]])
+    assert_eq(pdf, gdf)
+    # a value that needs dtype promotion falls back to per-column loc
+    pdf.loc[[1, 3], ["a", "b"]] = np.array([[0.5, 1.5], [2.5, 3.5]])
+    gdf.loc[[1, 3], ["a", "b"]] = np.array([[0.5, 1.5], [2.5, 3.5]])
+    assert_eq(pdf, gdf, check_dtype=False)
@@ -34,6 +34,24 @@ def gpu_diff(in_col, out_col, out_mask, N):
             out_mask[i] = False
 
 
+@cuda.jit
+def gpu_mask_between(arr, start, stop, out):
+    """Mark the positions whose value falls within [start, stop]."""
+    i = cuda.grid(1)
+    if i < arr.size:
+        out[i] = arr[i] >= start and arr[i] <= stop
+
+
+def mask_between(arr, start, stop):
+    """Compute a boolean mask for ``start <= arr <= stop`` in a single
+    pass over ``arr``.
+    """
+    out = cuda.device_array(shape=(arr.shape), dtype=np.bool_)
+    if arr.size > 0:
+        gpu_mask_between.forall(arr.size)(arr, start, stop, out)
+    return out
+
+
 # Find segments
 
 